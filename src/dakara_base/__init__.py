@@ -4,19 +4,24 @@ Dakara base.
 Collection of tools and helper modules for the Dakara Project.
 """
 
-from dakara_base import (
-    config,
-    directory,
-    exceptions,
-    http_client,
-    progress_bar,
-    safe_workers,
-    utils,
-    version,
-    websocket_client,
-)
+import importlib
+
 from dakara_base.version import __date__, __version__
 
+# submodules are imported on first access, so that importing one of them does
+# not import the dependencies of all the others
+SUBMODULES = [
+    "config",
+    "directory",
+    "exceptions",
+    "http_client",
+    "progress_bar",
+    "safe_workers",
+    "utils",
+    "version",
+    "websocket_client",
+]
+
 __all__ = [
     "config",
     "directory",
@@ -30,3 +35,10 @@ __all__ = [
     "__version__",
     "__date__",
 ]
+
+
+def __getattr__(name):
+    if name in SUBMODULES:
+        return importlib.import_module("{}.{}".format(__name__, name))
+
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
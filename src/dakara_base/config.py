@@ -33,21 +33,35 @@ the configuration directory:
 """
 
 
+import atexit
 import logging
-from collections import UserDict
-from distutils.util import strtobool
+import os
+import sys
+from collections.abc import Hashable, ItemsView, Mapping, ValuesView
+from contextlib import ExitStack
+from functools import lru_cache
+from threading import Lock
 
-import coloredlogs
-import progressbar
 import yaml
 from environs import Env, EnvError
 from path import Path
 
 try:
-    from importlib.resources import path
+    from importlib.resources import as_file, files
 
 except ImportError:
-    from importlib_resources import path
+    from importlib_resources import as_file, files
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+
+except ImportError:
+    from yaml import SafeLoader
+
+    # the pure Python loader is much slower than the LibYAML one
+    logging.getLogger(__name__).warning(
+        "LibYAML is not available, config files will be parsed slowly"
+    )
 
 from dakara_base.directory import directories
 from dakara_base.exceptions import DakaraError
@@ -57,16 +71,154 @@ LOG_LEVEL = "INFO"
 
 logger = logging.getLogger(__name__)
 
+# settings of the last installed logger and its current level, to avoid
+# setting them again
+logger_settings = None
+logger_level = None
+
+# YAML nodes of composed config files with their modification time and size,
+# indexed by path, so that only the last version of a file is kept
+config_cache = {}
+config_cache_lock = Lock()
+
+# resources extracted to temporary files are kept until the end of the program
+resources_stack = ExitStack()
+atexit.register(resources_stack.close)
+
+# snapshot of the environment variables, see `cache_environment`
+environ_snapshot = None
+
+# marker of a value not set in environment variables
+NOT_SET = object()
+
+# string representations of truth, as accepted by `distutils.util.strtobool`
+BOOLEAN_STRINGS = {
+    "y": True,
+    "yes": True,
+    "t": True,
+    "true": True,
+    "on": True,
+    "1": True,
+    "n": False,
+    "no": False,
+    "f": False,
+    "false": False,
+    "off": False,
+    "0": False,
+}
+
+
+# types of implicit YAML scalars resolved in config files
+CONFIG_IMPLICIT_TAGS = {
+    "tag:yaml.org,2002:bool",
+    "tag:yaml.org,2002:float",
+    "tag:yaml.org,2002:int",
+    "tag:yaml.org,2002:merge",
+    "tag:yaml.org,2002:null",
+}
+
+# tag of YAML mappings
+MAPPING_TAG = "tag:yaml.org,2002:map"
+
+
+class ConfigLoader(SafeLoader):
+    """YAML loader for config files.
+
+    It resolves less implicit types than the safe loader, so that less regular
+    expressions are tested on each scalar. Timestamps are kept as strings, as
+    are values from environment variables.
+    """
+
+    yaml_implicit_resolvers = {
+        first: [
+            (tag, regexp) for tag, regexp in resolvers if tag in CONFIG_IMPLICIT_TAGS
+        ]
+        for first, resolvers in SafeLoader.yaml_implicit_resolvers.items()
+    }
+
+    def construct_config(self, node, config):
+        """Populate a config with the content of a mapping node.
+
+        Nested mappings are directly constructed as nested configs, with
+        accumulated prefixes, so that the content is not converted again once
+        constructed.
+
+        Args:
+            node (yaml.MappingNode): Node to construct.
+            config (Config): Config to populate.
+
+        Returns:
+            Config: Populated config.
+
+        Raises:
+            yaml.constructor.ConstructorError: If a key cannot be constructed.
+        """
+        self.flatten_mapping(node)
+        for key_node, value_node in node.value:
+            key = self.construct_object(key_node, deep=True)
+            if not isinstance(key, Hashable):
+                raise yaml.constructor.ConstructorError(
+                    "while constructing a mapping",
+                    node.start_mark,
+                    "found unhashable key",
+                    key_node.start_mark,
+                )
+
+            if value_node.tag == MAPPING_TAG:
+                value = self.construct_config(
+                    value_node, config.__class__(f"{config.prefix}_{key}")
+                )
+
+            else:
+                value = self.construct_object(value_node, deep=True)
+
+            config[key] = value
+
+        return config
+
 
 class AutoEnv(Env):
-    """Environment variable reader with an automatic method."""
+    """Environment variable reader with an automatic method.
+
+    If a snapshot of the environment is taken with `cache_environment`,
+    variables are read from it, so that typed values and untyped values read
+    by configs are the same. This is not possible if variables are expanded
+    (with `expand_vars=True`), in which case they are always read from the
+    process environment. Configs do not expand variables.
+
+    Attributes:
+        parsers (dict): Parsing methods by type, resolved on first use.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.parsers = {}
 
     def auto(self, type, *args, **kwargs):
-        type_str = type.__name__
-        return getattr(self, type_str)(*args, **kwargs)
+        # resolve the parsing method from the name of the type only once
+        try:
+            parser = self.parsers[type]
+
+        except KeyError:
+            parser = self.parsers[type] = getattr(self, type.__name__)
+
+        return parser(*args, **kwargs)
+
+    def _get_from_environ(self, key, default, *, proxied=False):
+        # read variables from the snapshot of the environment if any, so that
+        # typed and untyped values come from the same source
+        # this private method is called by all the parsing methods of
+        # `environs.Env`, its signature and its returned tuple (key, value,
+        # proxied key) mirror those of environs 9.5, which is pinned in
+        # setup.cfg
+        if environ_snapshot is None or self.expand_vars:
+            return super()._get_from_environ(key, default, proxied=proxied)
+
+        env_key = self._get_key(key, omit_prefix=proxied)
+        return env_key, environ_snapshot.get(env_key, default), None
 
 
-class Config(UserDict):
+class Config(dict):
     """Configuration object.
 
     This object behaves similarly to a dictionary. Its values can be populated
@@ -116,10 +268,32 @@ class Config(UserDict):
     You can check `environs.Env` for the supported types. Note stored values
     are parsed from the config file by the YAML library.
 
+    The object is a subclass of `dict`. Views given by `items` and `values`,
+    `pop`, `popitem`, `setdefault`, comparisons, copies and unpacked configs
+    also check environment variables first.
+    However, membership tests with `in` and `keys` only consider stored keys,
+    so that they do not look up environment variables:
+
+    >>> conf = Config("prefix", {"key": "foo"})
+    >>> # let's say PREFIX_OTHER is an environment variable with value "bar"
+    >>> "other" in conf
+    False
+
     Attributes:
         prefix (str): Prefix to use when looking for value in environment
             variables.
+        env_prefix (str): Upper case prefix of environment variables names,
+            including the separating underscore.
         env (AutoEnv): Environment parser.
+        env_names (dict): Names of environment variables by key, computed on
+            first use.
+        env_cache (dict): Values from environment variables by key and by
+            type, memoized while a snapshot of the environment is used.
+        env_cache_snapshot (dict): Snapshot of the environment used for the
+            memoized values.
+        env_names_snapshot (set of str): Names of environment variables with
+            the prefix in the snapshot of the environment used for the
+            memoized values.
 
     Args:
         prefix (str): Prefix to use when looking for value in environment
@@ -131,7 +305,15 @@ class Config(UserDict):
         super().__init__()
 
         self.prefix = prefix
+        self.env_prefix = prefix.upper() + "_"
         self.env = AutoEnv()
+        self.env_names = {}
+
+        # values from environment variables, memoized while a snapshot of the
+        # environment is used
+        self.env_cache = {}
+        self.env_cache_snapshot = None
+        self.env_names_snapshot = set()
 
         # create values in object if any provided
         if iterable:
@@ -140,24 +322,27 @@ class Config(UserDict):
     def set_iterable(self, iterable):
         """Set config values from the provided iterable.
 
-        Dictionaries will be converted into Config with a sub-prefix.
+        Dictionaries will be converted into Config with a sub-prefix. Note
+        that instances of subclasses of `dict` are stored as is.
 
         Args:
             iterable (dict): Dictionary of values.
         """
-        # recursively convert dictionaries into Config objects
-        iterable = {
-            key: (
-                self.__class__("{}_{}".format(self.prefix, key), val)
-                if isinstance(val, dict)
-                else val
-            )
-            for key, val in iterable.items()
-        }
-
-        # reset config data with values from the iterable
-        self.data.clear()
-        self.data.update(iterable)
+        # reset config data
+        self.clear()
+
+        # fill config data with values from the iterable, and convert
+        # dictionaries into Config objects, level by level without recursion
+        stack = [(self, iterable)]
+        while stack:
+            config, values = stack.pop()
+            for key, val in values.items():
+                if type(val) is dict:
+                    child = self.__class__(f"{config.prefix}_{key}")
+                    stack.append((child, val))
+                    val = child
+
+                config[key] = val
 
     def set_debug(self, debug=True):
         """Set log level of the config to debug.
@@ -166,16 +351,26 @@ class Config(UserDict):
             debug (bool): If `True` (default), set log level to "DEBUG".
         """
         if debug:
-            self.data["loglevel"] = "DEBUG"
+            self["loglevel"] = "DEBUG"
 
     def check_mandatory_keys(self, keys):
         """Check if a list of keys is present in the config.
 
+        All missing keys are reported at once.
+
         Args:
             keys (list of str): Keys that must be present in the config.
+
+        Raises:
+            ConfigInvalidError: If the config misses critical sections.
         """
-        for key in keys:
-            self.check_mandatory_key(key)
+        missing = set(keys).difference(self)
+        if missing:
+            raise ConfigInvalidError(
+                "Invalid config file, missing {}".format(
+                    ", ".join("'{}'".format(key) for key in sorted(missing))
+                )
+            )
 
     def check_mandatory_key(self, key):
         """Check if a key is present in the config.
@@ -186,14 +381,20 @@ class Config(UserDict):
         Raises:
             ConfigInvalidError: If the config misses a critical section.
         """
-        if key not in self.data:
+        if key not in self:
             raise ConfigInvalidError("Invalid config file, missing '{}'".format(key))
 
-    def load_file(self, config_path):
+    def load_file(self, config_path, cache_env=False):
         """Load config from a given YAML file.
 
+        The composed content of the file is cached, so that it is parsed again
+        only if the file has been modified. The config is constructed directly
+        from this content.
+
         Args:
             config_path (path.Path): Path to the config file.
+            cache_env (bool): If True, take a snapshot of the environment
+                variables once the file is loaded. See `cache_environment`.
 
         Raises:
             ConfigNotFoundError: If the config file cannot be open.
@@ -201,17 +402,74 @@ class Config(UserDict):
         """
         logger.info("Loading config file '%s'", config_path)
 
-        # load and parse the file and create config data
         try:
-            with config_path.open() as file:
-                self.set_iterable(yaml.safe_load(file))
+            stat = config_path.stat()
+            key = str(config_path)
+            version = (stat.st_mtime_ns, stat.st_size)
+
+            # compose the file, unless it has been composed already and has not
+            # been modified since
+            with config_cache_lock:
+                cached_version, node = config_cache.get(key, (None, None))
+
+            if cached_version != version:
+                # the file is read at once, so that LibYAML can parse the whole
+                # buffer
+                with config_path.open("rb") as file:
+                    data = file.read()
+
+                node = yaml.compose(data, Loader=ConfigLoader)
+
+            if node is None or node.tag != MAPPING_TAG:
+                raise ConfigParseError("Config file must contain a mapping")
+
+            # construct a new config from the nodes, so that the cache cannot
+            # be altered, and so that the current content is kept on error
+            config = self.__class__(self.prefix)
+            loader = ConfigLoader("")
+            try:
+                loader.construct_config(node, config)
+
+            finally:
+                loader.dispose()
+
+            # replace the content with the stored values of the new config
+            self.clear()
+            for config_key, value in dict.items(config):
+                self[config_key] = value
 
-        except yaml.parser.ParserError as error:
+            # the nodes are cached once constructed, as merge keys are
+            # flattened during construction
+            with config_cache_lock:
+                config_cache[key] = (version, node)
+
+        except yaml.YAMLError as error:
             raise ConfigParseError("Unable to parse config file") from error
 
         except FileNotFoundError as error:
             raise ConfigNotFoundError("No config file found") from error
 
+        if cache_env:
+            cache_environment()
+
+    def get_env_name(self, key):
+        """Get the name of the environment variable of a key.
+
+        The name is computed once per key.
+
+        Args:
+            key (str): Name of the variable without prefix.
+
+        Returns:
+            str: Prefixed upper case name of the environment variable.
+        """
+        try:
+            return self.env_names[key]
+
+        except KeyError:
+            name = self.env_names[key] = self.env_prefix + key.upper()
+            return name
+
     def get_value_from_env(self, key, type=None):
         """Get the value from prefixed upper case environment variable.
 
@@ -222,23 +480,205 @@ class Config(UserDict):
 
         Returns:
             str: Value from environment variable.
+
+        Raises:
+            environs.EnvError: If the environment variable is not set or
+                cannot be parsed.
         """
-        with self.env.prefixed("{}_".format(self.prefix.upper())):
-            # use type if provided
-            if type:
-                return self.env.auto(type, key.upper())
+        name = self.get_env_name(key)
+        environ = os.environ if environ_snapshot is None else environ_snapshot
 
-            # fallback to default behavior
-            return self.env(key.upper())
+        # the variable is not set, which is the most common case
+        if name not in environ:
+            raise EnvError('Environment variable "{}" not set'.format(name))
+
+        # use type if provided
+        if type:
+            return self.env.auto(type, name)
+
+        # fallback to default behavior
+        return environ[name]
+
+    def lookup_env(self, key, type=None):
+        """Get the value from environment variable if it exists.
+
+        If a snapshot of the environment is used, the value is memoized for
+        the lifetime of the snapshot, and keys that are not overridden in the
+        snapshot are skipped at once.
+
+        Args:
+            key (str): Name of the variable without prefix.
+            type (type): Type of the variable. If not provided, default to
+                string.
+
+        Returns:
+            any: Value from environment variable, or `NOT_SET` if the variable
+            is not set or cannot be parsed.
+        """
+        # values cannot be memoized if the environment can change
+        if environ_snapshot is None:
+            try:
+                return self.get_value_from_env(key, type)
+
+            except EnvError:
+                return NOT_SET
+
+        # discard values memoized with a previous snapshot, and find which
+        # variables concern the config in the new one
+        if self.env_cache_snapshot is not environ_snapshot:
+            self.env_cache.clear()
+            self.env_cache_snapshot = environ_snapshot
+            self.env_names_snapshot = {
+                name for name in environ_snapshot if name.startswith(self.env_prefix)
+            }
+
+        # most keys are not overridden
+        if self.get_env_name(key) not in self.env_names_snapshot:
+            return NOT_SET
+
+        values = self.env_cache.setdefault(key, {})
+        if type not in values:
+            try:
+                values[type] = self.get_value_from_env(key, type)
+
+            except EnvError:
+                values[type] = NOT_SET
+
+        return values[type]
 
     def __getitem__(self, key):
         # try to get value from environment
-        try:
-            return self.get_value_from_env(key)
-
-        except EnvError:
+        value = self.lookup_env(key)
+        if value is NOT_SET:
             return super().__getitem__(key)
 
+        return value
+
+    def __setitem__(self, key, value):
+        # intern string keys, as they are usually looked up with literal strings
+        if type(key) is str:
+            key = sys.intern(key)
+
+        # forget memoized values from environment for this key
+        self.env_cache.pop(key, None)
+        super().__setitem__(key, value)
+
+    def __iter__(self):
+        # overriding this method prevents `dict` from copying the stored values
+        # directly when the config is unpacked or converted, as with `dict` or
+        # `**`, so that values are obtained with `__getitem__`
+        return super().__iter__()
+
+    def copy(self):
+        """Return a shallow copy of the config.
+
+        Values are obtained from environment variables if possible.
+
+        Returns:
+            Config: Copy of the config, with the same prefix.
+        """
+        config = self.__class__(self.prefix)
+        config.update(self)
+        return config
+
+    def pop(self, key, default=NOT_SET):
+        """Remove a key and return its value.
+
+        The value is obtained from environment variables if possible, but only
+        stored keys can be removed.
+
+        Args:
+            key (any): Key to remove.
+            default (any): Value returned if the key cannot be found.
+
+        Returns:
+            any: Value.
+
+        Raises:
+            KeyError: If the key cannot be found and no default value is
+                provided.
+        """
+        if key not in self:
+            if default is NOT_SET:
+                raise KeyError(key)
+
+            return default
+
+        value = self[key]
+        del self[key]
+        return value
+
+    def popitem(self):
+        """Remove an item and return it.
+
+        The value is obtained from environment variables if possible.
+
+        Returns:
+            tuple: Key and value.
+
+        Raises:
+            KeyError: If the config is empty.
+        """
+        key, value = super().popitem()
+        value_env = self.lookup_env(key)
+        if value_env is NOT_SET:
+            return key, value
+
+        return key, value_env
+
+    def setdefault(self, key, default=None):
+        """Return the value of a key, set it with a default value if missing.
+
+        The value is obtained from environment variables if possible, but the
+        default value is set if the key is not stored.
+
+        Args:
+            key (any): Key to retreive.
+            default (any): Value set and returned if the key cannot be found.
+
+        Returns:
+            any: Value.
+        """
+        if key not in self:
+            self[key] = default
+            return default
+
+        return self[key]
+
+    def __eq__(self, other):
+        # compare values obtained from environment variables if possible
+        if not isinstance(other, Mapping):
+            return NotImplemented
+
+        return dict(self) == dict(other)
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return equal
+
+        return not equal
+
+    def items(self):
+        """Return a view of the config items.
+
+        Values are obtained from environment variables if possible.
+
+        Returns:
+            collections.abc.ItemsView: View of the items.
+        """
+        return ItemsView(self)
+
+    def values(self):
+        """Return a view of the config values.
+
+        Values are obtained from environment variables if possible.
+
+        Returns:
+            collections.abc.ValuesView: View of the values.
+        """
+        return ValuesView(self)
+
     def get(self, key, default=None):
         """Return the value for the provided key.
 
@@ -258,12 +698,38 @@ class Config(UserDict):
             cast = type(default)
 
         # get value from environment, then from dict
-        try:
-            return self.get_value_from_env(key, cast)
-
-        except EnvError:
+        value = self.lookup_env(key, cast)
+        if value is NOT_SET:
             return super().get(key, default)
 
+        return value
+
+
+def cache_environment(cache=True):
+    """Take a snapshot of the environment variables.
+
+    Configs use this snapshot to look for values in environment variables,
+    which avoids to query the process environment on each access. This is
+    relevant only if the environment does not change during the execution of
+    the program.
+
+    Args:
+        cache (bool): If True (default), take a new snapshot. Otherwise, drop
+            the snapshot and use the process environment again.
+    """
+    global environ_snapshot
+    environ_snapshot = dict(os.environ) if cache else None
+
+
+def clear_config_cache():
+    """Clear the content of config files that have already been composed.
+
+    Composed config files are cached by `Config.load_file` as long as they are
+    not modified.
+    """
+    with config_cache_lock:
+        config_cache.clear()
+
 
 def create_logger(wrap=False, custom_log_format=None, custom_log_level=None):
     """Create logger.
@@ -275,14 +741,28 @@ def create_logger(wrap=False, custom_log_format=None, custom_log_level=None):
         custom_log_format (str): Custom format string to use for logs.
         custom_log_level (str): Custom level of logging.
     """
+    # coloredlogs and progressbar are long to import and are only needed here
+    import coloredlogs
+    import progressbar
+
+    global logger_settings, logger_level
+    log_format = custom_log_format or LOG_FORMAT
+    log_level = custom_log_level or LOG_LEVEL
+
+    # do nothing if the logger was already created with these settings, and if
+    # its level has not been changed since
+    settings = (wrap, log_format, log_level)
+    if settings == logger_settings and log_level == logger_level:
+        return
+
     # wrap stderr on demand
     if wrap:
         progressbar.streams.wrap_stderr()
 
     # setup loggers
-    log_format = custom_log_format or LOG_FORMAT
-    log_level = custom_log_level or LOG_LEVEL
     coloredlogs.install(fmt=log_format, level=log_level)
+    logger_settings = settings
+    logger_level = log_level
 
 
 def set_loglevel(config):
@@ -291,8 +771,58 @@ def set_loglevel(config):
     Arguments:
         config (Config): Dictionary of the config.
     """
+    import coloredlogs
+
+    global logger_level
     loglevel = config.get("loglevel", LOG_LEVEL)
+
+    # do nothing if the level is unchanged
+    if loglevel == logger_level:
+        return
+
     coloredlogs.set_level(loglevel)
+    logger_level = loglevel
+
+
+def strtobool(value):
+    """Convert a string representation of truth to a boolean.
+
+    This replaces `distutils.util.strtobool`, as `distutils` is deprecated.
+
+    Args:
+        value (str): Value to convert, case insensitive. True values are "y",
+            "yes", "t", "true", "on" and "1", false values are "n", "no", "f",
+            "false", "off" and "0".
+
+    Returns:
+        bool: Converted value.
+
+    Raises:
+        ValueError: If the value cannot be converted.
+    """
+    try:
+        return BOOLEAN_STRINGS[value.lower()]
+
+    except KeyError as error:
+        raise ValueError("Invalid truth value '{}'".format(value)) from error
+
+
+@lru_cache(maxsize=32)
+def get_resource_path(resource, filename):
+    """Get the path of a file stored in module resources.
+
+    The path is cached. If the file has to be extracted to a temporary file,
+    for instance if the module is zipped, the temporary file is kept until the
+    end of the program.
+
+    Args:
+        resource (str): Resource where to find the file.
+        filename (str): Name of the file.
+
+    Returns:
+        path.Path: Path of the file.
+    """
+    return Path(resources_stack.enter_context(as_file(files(resource) / filename)))
 
 
 def create_config_file(resource, filename, force=False):
@@ -304,30 +834,29 @@ def create_config_file(resource, filename, force=False):
         force (bool): If True, config file in user directory is overwritten if
             it existed already. Otherwise, prompt the user.
     """
-    with path(resource, filename) as file:
-        # get the file
-        origin = Path(file)
-        destination = directories.user_config_dir / filename
+    # get the file
+    origin = get_resource_path(resource, filename)
+    destination = directories.user_config_dir / filename
 
-        # create directory
-        destination.dirname().mkdir_p()
+    # create directory
+    destination.dirname().mkdir_p()
 
-        # check destination does not exist
-        if not force and destination.exists():
-            try:
-                result = strtobool(
-                    input("{} already exists, overwrite? [y/N] ".format(destination))
-                )
+    # check destination does not exist
+    if not force and destination.exists():
+        try:
+            result = strtobool(
+                input("{} already exists, overwrite? [y/N] ".format(destination))
+            )
 
-            except ValueError:
-                result = False
+        except ValueError:
+            result = False
 
-            if not result:
-                return
+        if not result:
+            return
 
-        # copy file
-        origin.copyfile(destination)
-        logger.info("Config created in '{}'".format(destination))
+    # copy file
+    origin.copyfile(destination)
+    logger.info("Config created in '%s'", destination)
 
 
 class ConfigError(DakaraError):
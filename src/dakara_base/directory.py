@@ -8,7 +8,7 @@ This module gives application name and project name:
 ... "DakaraProject"
 
 It also gives an evolved version of `appdirs.AppDirs` that returns `path.Path`
-objects:
+objects, which are computed once:
 
 >>> type(directories.user_config_dir)
 ... path.Path
@@ -16,46 +16,56 @@ objects:
 from path import Path
 from platformdirs import PlatformDirs as AppDirs
 
+try:
+    from functools import cached_property
+
+except ImportError:
+    # Python 3.7 cannot cache properties
+    cached_property = property
+
 APP_NAME = "dakara"
 PROJECT_NAME = "DakaraProject"
 
 
 class AppDirsPath(AppDirs):
-    """AppDirs class that returns `path.Path` objects."""
+    """AppDirs class that returns `path.Path` objects.
+
+    Directories are resolved on first access only.
+    """
 
-    @property
+    @cached_property
     def site_config_dir(self):
         return Path(super().site_config_dir)
 
-    @property
+    @cached_property
     def site_data_dir(self):
         return Path(super().site_data_dir)
 
-    @property
+    @cached_property
     def user_cache_dir(self):
         return Path(super().user_cache_dir)
 
-    @property
+    @cached_property
     def user_config_dir(self):
         return Path(super().user_config_dir)
 
-    @property
+    @cached_property
     def user_data_dir(self):
         return Path(super().user_data_dir)
 
-    @property
+    @cached_property
     def user_documents_dir(self):
         return Path(super().user_documents_dir)
 
-    @property
+    @cached_property
     def user_log_dir(self):
         return Path(super().user_log_dir)
 
-    @property
+    @cached_property
     def user_runtime_dir(self):
         return Path(super().user_runtime_dir)
 
-    @property
+    @cached_property
     def user_state_dir(self):
         return Path(super().user_state_dir)
 
@@ -16,10 +16,14 @@ all program exceptions.
 """
 
 import logging
-from contextlib import contextmanager
+from contextlib import ContextDecorator, contextmanager
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# exception handlers already generated, by exception class and error message
+exception_handlers = {}
+
 
 class DakaraError(Exception):
     """Basic exception class for the project."""
@@ -52,6 +56,9 @@ def generate_exception_handler(exception_class, error_message):
     >>> assert isinstance(error, MyError)
     >>> assert isinstance(error, DakaraHandledError)
 
+    Handlers are stateless, so the same handler is given for the same
+    arguments.
+
     Args:
         exception_class (Exception or list of Exception): Exception class to
             catch.
@@ -59,22 +66,90 @@ def generate_exception_handler(exception_class, error_message):
             the next line after the exception message.
 
     Returns:
-        function: Context manager function.
+        ExceptionHandler: Callable that gives the context manager, which can
+        also be used as a decorator.
+    """
+    if isinstance(exception_class, list):
+        exception_class = tuple(exception_class)
+
+    key = (exception_class, error_message)
+    try:
+        return exception_handlers[key]
+
+    except KeyError:
+        handler = exception_handlers[key] = ExceptionHandler(
+            exception_class, error_message
+        )
+        return handler
+
+
+class ExceptionHandler(ContextDecorator):
+    """Context manager that takes care of given exception.
+
+    See `generate_exception_handler`. The context manager is stateless, so
+    calling the instance gives the instance itself, which can be used in
+    several `with` statements, or as a decorator:
+
+    >>> handle_my_error = generate_exception_handler(MyError, "extra message")
+    >>> @handle_my_error()
+    ... def function():
+    ...     raise MyError("initial message")
+
+    Attributes:
+        exception_class (Exception or tuple of Exception): Exception class to
+            catch.
+        error_message (str): Error message to display.
+
+    Args:
+        exception_class (Exception or list of Exception): Exception class to
+            catch.
+        error_message (str): Error message to display. It will be displayed on
+            the next line after the exception message.
     """
 
-    @contextmanager
-    def function():
-        try:
-            yield None
+    def __init__(self, exception_class, error_message):
+        if isinstance(exception_class, list):
+            exception_class = tuple(exception_class)
+
+        self.exception_class = exception_class
+        self.error_message = error_message
+
+    def __call__(self, func=None):
+        if func is None:
+            return self
+
+        return super().__call__(func)
+
+    def __enter__(self):
+        return None
 
-        except exception_class as error:
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None or not issubclass(exc_type, self.exception_class):
+            return False
 
-            class HandledError(error.__class__, DakaraHandledError):
-                pass
+        raise get_handled_error_class(exc_type)(
+            f"{exc_value}\n{self.error_message}"
+        ) from exc_value
+
+
+@lru_cache(maxsize=None)
+def get_handled_error_class(exception_class):
+    """Get the handled variant of an exception class.
+
+    The class is created once per exception class.
+
+    Args:
+        exception_class (Exception): Exception class that has been handled.
+
+    Returns:
+        Exception: Subclass of both `exception_class` and
+        `DakaraHandledError`.
+    """
 
-            raise HandledError("{}\n{}".format(error, error_message)) from error
+    class HandledError(exception_class, DakaraHandledError):
+        pass
 
-    return function
+    return HandledError
 
 
 class ExitValue:
@@ -35,16 +35,36 @@ from progressbar.widgets import WidgetBase
 
 logger = logging.getLogger(__name__)
 
+# minimum interval between two redraws of the progress bar, in seconds
+MIN_POLL_INTERVAL = 0.5
+
+# the width of the text widget is a multiple of this step, so that it does not
+# change on small terminal resizes
+TEXT_WIDTH_STEP = 4
+
+# minimum width of the text widget, so that truncated text can be displayed
+TEXT_WIDTH_MIN = 8
+
 
 class ShrinkableTextWidget(WidgetBase):
     """Widget which size auto-shrinks with terminal width.
 
     It contains a descriptive text using by default one quarter of the screen
-    width, which can be truncated by the middle if it does not fit.
+    width, which can be truncated by the middle if it does not fit. This width
+    is rounded down to a multiple of `TEXT_WIDTH_STEP`, and is at least
+    `TEXT_WIDTH_MIN`.
 
     Args:
         text (str): Text to display on screen.
         ratio (float): Ratio of screen width to use for text.
+
+    Attributes:
+        text (str): Text to display on screen.
+        text_length (int): Length of the text.
+        ratio (float): Ratio of screen width to use for text.
+        cached_term_width (int): Terminal width of the last update.
+        cached_output (str): Displayed text of the last update.
+        outputs (dict): Displayed texts by widget width.
     """
 
     def __init__(self, text, ratio=0.25):
@@ -52,17 +72,52 @@ class ShrinkableTextWidget(WidgetBase):
 
         assert len(text) > 5, "Text too short"
         self.text = text
+        self.text_length = len(text)
         self.ratio = ratio
+        self.cached_term_width = None
+        self.cached_output = None
+        self.outputs = {}
 
     def __call__(self, progress, data):
+        # the output only changes when the terminal is resized
+        term_width = progress.term_width
+        if term_width == self.cached_term_width:
+            return self.cached_output
+
         # set widget width to a fraction of terminal width
-        width = int(progress.term_width * self.ratio)
+        width = int(term_width * self.ratio) // TEXT_WIDTH_STEP * TEXT_WIDTH_STEP
+        width = max(width, TEXT_WIDTH_MIN)
+
+        # the output for a given width is created only once
+        output = self.outputs.get(width)
+        if output is None:
+            output = self.outputs[width] = self.create_output(width)
+
+        self.cached_term_width = term_width
+        self.cached_output = output
+
+        return output
 
-        # truncate text if necessary
+    def create_output(self, width):
+        """Create the displayed text for a given width.
+
+        Args:
+            width (int): Width of the widget.
+
+        Returns:
+            str: Text truncated by the middle if necessary, padded to the
+            width.
+        """
         text = self.text
-        if len(text) > width:
-            half = int(width * 0.5)
-            text = text[: half - 2].strip() + "..." + text[-half + 1 :].strip()
+
+        # pad text if it fits
+        if self.text_length <= width:
+            return text.ljust(width)
+
+        # truncate text otherwise, only the inner edges of the halves can carry
+        # whitespaces
+        half = int(width * 0.5)
+        text = f"{text[: half - 2].rstrip()}...{text[-half + 1 :].lstrip()}"
 
         return text.ljust(width)
 
@@ -73,6 +128,9 @@ def progress_bar(iterator, *args, text=None, **kwargs):
     It prints an optionnal shrinkable text (if a text is provided), a
     percentage progress, a progress bar and an adaptative ETA.
 
+    The bar is redrawn at most every `MIN_POLL_INTERVAL` seconds, unless
+    `min_poll_interval` is passed.
+
     Args:
         iterator (iterator): Iterator of items to use the bar with.
         text (str): Text to display describing the current operation.
@@ -99,6 +157,9 @@ def progress_bar(iterator, *args, text=None, **kwargs):
         ]
     )
 
+    # limit the redraw rate for fast iterators
+    kwargs.setdefault("min_poll_interval", MIN_POLL_INTERVAL)
+
     # create progress bar
     with progressbar.ProgressBar(*args, widgets=widgets, **kwargs) as progress:
         for item in progress(iterator):
@@ -106,22 +167,21 @@ def progress_bar(iterator, *args, text=None, **kwargs):
 
 
 def null_bar(iterator, *args, text=None, **kwargs):
-    """Generator that gives the defaylt muted progress bar for the project.
+    """Gives the default muted progress bar for the project.
 
-    It only logs the optionnal text.
+    It only logs the optionnal text, and gives the items directly. Other
+    arguments are accepted for compatibility with `progress_bar`, but are
+    ignored.
 
     Args:
         iterator (iterator): Iterator of items to use the bar with.
         text (str): Text to log describing the current operation.
 
     Returns:
-        generator object: Item handled by the progress bar.
+        iterator: Iterator of the items.
     """
     # log text immediately
     if text:
         logger.info(text)
 
-    # create null progress bar
-    with progressbar.NullBar(*args, **kwargs) as progress:
-        for item in progress(iterator):
-            yield item
+    return iter(iterator)
@@ -13,7 +13,7 @@ It was initialy designed to cut Django responses during development, as some
 internal errors could make the server to respond by a very long HTML message,
 polluting the logs.
 
-The `create_url` is an URL creator build on top of the furl module. It is
+The `create_url` is an URL creator build on top of `urllib.parse`. It is
 typically designed to take a server config and forge an URL from it, wether the
 URL is explicitally defined, or its components are individually defined, such
 as host, port, etc.:
@@ -25,11 +25,30 @@ as host, port, etc.:
 ... }
 >>> create_url(**config)
 "https://www.example.com:8080/api/"
+
+Created URLs are cached, as they are usually created several times from the
+same config.
 """
-from furl import furl
+import re
+from collections.abc import Hashable
+from functools import lru_cache
+from urllib.parse import quote, urlsplit, urlunsplit
 
 from dakara_base.exceptions import DakaraError
 
+# ports omitted from URLs, by scheme
+DEFAULT_PORTS = {"http": 80, "https": 443, "ws": 80, "wss": 443}
+
+# characters that cannot be used in a host, colons are checked separately
+INVALID_HOST_CHARACTERS = re.compile(r"[/?#@\s]")
+
+# characters that are not percent-encoded in a path, in addition to letters,
+# digits and "_.-~"
+PATH_SAFE_CHARACTERS = "/!$&'()*+,;=:@%"
+
+# percent signs that do not start a percent-encoded character
+INVALID_PERCENT = re.compile(r"%(?![0-9A-Fa-f]{2})")
+
 
 def truncate_message(message, limit=100):
     """Display the first characters of a message.
@@ -49,7 +68,7 @@ def truncate_message(message, limit=100):
     if len(message) <= limit:
         return message
 
-    return message[: limit - 3].strip() + "..."
+    return f"{message[: limit - 3].rstrip()}..."
 
 
 def create_url(
@@ -61,7 +80,7 @@ def create_url(
     ssl=False,
     scheme_no_ssl="http",
     scheme_ssl="https",
-    **kwargs
+    **kwargs,
 ):
     """Create an URL from arguments.
 
@@ -87,20 +106,60 @@ def create_url(
 
     Raises:
         URLParameterError: If `scheme` or `host` cannot be defined, or if the
-            parameters are invalid to `furl.furl`.
+            URL, the address or the port are invalid.
+    """
+    # extra arguments are discarded, so that the remaining ones can be cached
+    arguments = (url, address, host, port, path, ssl, scheme_no_ssl, scheme_ssl)
+    if all(isinstance(argument, Hashable) for argument in arguments):
+        return create_url_cached(*arguments)
+
+    # unhashable arguments cannot be cached
+    return create_url_cached.__wrapped__(*arguments)
+
+
+@lru_cache(maxsize=32)
+def create_url_cached(url, address, host, port, path, ssl, scheme_no_ssl, scheme_ssl):
+    """Create an URL from arguments and cache it.
+
+    See `create_url` for the arguments.
+
+    Returns:
+        str: URL string.
+
+    Raises:
+        URLParameterError: If `scheme` or `host` cannot be defined, or if the
+            URL, the address or the port are invalid.
     """
     # setting URL directly
     if url:
-        return furl(url).add(path=path).url
+        try:
+            parts = urlsplit(url)
+
+        except ValueError as error:
+            raise URLParameterError(
+                "Error when setting URL in server config: {}".format(error)
+            ) from error
+
+        return urlunsplit(parts._replace(path=join_url_path(parts.path, path)))
 
     # getting host and port indirectly from address
     if not host:
         # try to separete host and port if they are both given in
-        # address key in the form host:port
-        try:
-            host, port = address.split(":")
-
-        except ValueError:
+        # address key in the form host:port, the host can be an IPv6 address
+        # within brackets
+        host, separator, port_address = address.rpartition(":")
+        if separator and "]" not in port_address:
+            # the host can contain colons only if it is an IPv6 address within
+            # brackets
+            if ":" in host and not (host.startswith("[") and host.endswith("]")):
+                raise URLParameterError(
+                    "Error when setting URL in server config: invalid address "
+                    "'{}'".format(address)
+                )
+
+            port = port_address
+
+        else:
             host = address
 
     # getting scheme
@@ -117,14 +176,57 @@ def create_url(
             "'url', 'address', 'host', 'port' and/or 'ssl'"
         )
 
+    # check host, which can contain colons only if it is an IPv6 address within
+    # brackets
+    if INVALID_HOST_CHARACTERS.search(host) or (
+        ":" in host and not (host.startswith("[") and host.endswith("]"))
+    ):
+        raise URLParameterError(
+            "Error when setting URL in server config: invalid host '{}'".format(host)
+        )
+
+    # check port
+    if port is not None:
+        try:
+            port = int(port)
+            if not 0 < port < 65536:
+                raise ValueError
+
+        except (TypeError, ValueError) as error:
+            raise URLParameterError(
+                "Error when setting URL in server config: invalid port '{}'".format(
+                    port
+                )
+            ) from error
+
     # combine the arguments
-    try:
-        return furl(scheme=scheme, host=host, port=port, path=path).url
+    if port is None or port == DEFAULT_PORTS.get(scheme):
+        netloc = host
 
-    except ValueError as error:
-        raise URLParameterError(
-            "Error when setting URL in server config: {}".format(error)
-        ) from error
+    else:
+        netloc = "{}:{}".format(host, port)
+
+    return urlunsplit((scheme, netloc, join_url_path("", path), "", ""))
+
+
+def join_url_path(base, path):
+    """Append a path to the path of an URL.
+
+    The appended path is percent-encoded, except for characters already
+    percent-encoded.
+
+    Args:
+        base (str): Path of the URL.
+        path (str): Path to append.
+
+    Returns:
+        str: Joined path, with exactly one slash between both paths.
+    """
+    if not path:
+        return base
+
+    path = quote(INVALID_PERCENT.sub("%25", path), safe=PATH_SAFE_CHARACTERS)
+    return "{}/{}".format(base.rstrip("/"), path.lstrip("/"))
 
 
 class URLParameterError(DakaraError, ValueError):
@@ -40,6 +40,29 @@ from websocket import (
     WebSocketConnectionClosedException,
 )
 
+try:
+    # orjson decoding errors are subclasses of `json.JSONDecodeError`, and its
+    # encoding errors are subclasses of `TypeError`, like for `json`
+    from orjson import OPT_NON_STR_KEYS
+    from orjson import dumps as orjson_dumps
+    from orjson import loads as json_loads
+
+    def json_dumps(obj):
+        """Serialize an object to a compact JSON string with orjson.
+
+        Args:
+            obj (any): Serializable object.
+
+        Returns:
+            str: JSON string.
+        """
+        return orjson_dumps(obj, option=OPT_NON_STR_KEYS).decode()
+
+except ImportError:
+    from json import loads as json_loads
+
+    json_dumps = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
 from dakara_base.exceptions import DakaraError
 from dakara_base.safe_workers import WorkerSafeTimer, safe
 from dakara_base.utils import create_url, truncate_message
@@ -48,6 +71,10 @@ logger = logging.getLogger(__name__)
 
 
 RECONNECT_INTERVAL = 5
+RECONNECT_INTERVAL_MAX = 60
+
+# prefix of the name of methods handling received messages
+RECEIVE_PREFIX = "receive_"
 
 
 def connected(fun):
@@ -86,22 +113,34 @@ class WebSocketClient(WorkerSafeTimer):
     its type, which name is `receive_<type of the message here>`. The method
     must accept one argument, which is the `data` key of the message.
 
-    If the client is disconnected to the server, it tries to reconnect every
-    `reconnect_interval` seconds.
+    If the client is disconnected to the server, it tries to reconnect after
+    `reconnect_interval` seconds. This delay is doubled after each failed
+    attempt, up to `reconnect_interval_max` seconds.
 
     Being a `safe_workers.WorkerSafeTimer`, any non caught exception in
     callbacks will stop the entire program. Also, the class is a context
     manager which abort the connection on exit.
 
     Attributes:
+        ERROR_HANDLERS (dict): Names of the methods handling errors given to
+            `on_error`, by class of error. If there is no method for the
+            exact class of an error, its parent classes are checked in order.
         server_url (str): URL of the server.
         header (dict): Header to add to the HTTP requests for authentication.
         websocket (websocket.WebSocketApp): WebSocket connection object.
         retry (bool): Flag to retry a connection if it was lost.
-        reconnect_interval (int): Interval in seconds between two reconnection
-            attempts.
+        reconnect_interval (int): Interval in seconds before the first
+            reconnection attempt.
+        reconnect_interval_max (int): Maximum interval in seconds between two
+            reconnection attempts.
+        reconnect_delay (int): Interval in seconds before the next
+            reconnection attempt.
         callbacks (dict): Dictionary of extra callback actions to call on
             receiving messages.
+        message_handlers (dict): Methods handling received messages, by type
+            of message. Methods set after initialization are added on their
+            first use. Once in the table, a method cannot be replaced by
+            setting the attribute of the same name on the instance.
         timer (threading.Timer): Timer used for reconnection.
 
     Args:
@@ -111,6 +150,13 @@ class WebSocketClient(WorkerSafeTimer):
         header (dict): Header containing the authentication token.
     """
 
+    ERROR_HANDLERS = {
+        WebSocketBadStatusException: "handle_authentication_error",
+        ConnectionRefusedError: "handle_network_error",
+        ConnectionResetError: "handle_endpoint_error",
+        WebSocketConnectionClosedException: "handle_closed_error",
+    }
+
     def init_worker(self, config, endpoint="", header={}):
         # url
         self.server_url = create_url(
@@ -122,11 +168,26 @@ class WebSocketClient(WorkerSafeTimer):
         self.websocket = None
         self.retry = False
         self.reconnect_interval = config.get("reconnect_interval", RECONNECT_INTERVAL)
+        self.reconnect_interval_max = max(
+            config.get("reconnect_interval_max", RECONNECT_INTERVAL_MAX),
+            self.reconnect_interval,
+        )
+        self.reconnect_delay = self.reconnect_interval
 
         # create callbacks
         self.callbacks = {}
         self.set_default_callbacks()
 
+        # get methods handling received messages once
+        self.message_handlers = {}
+        for name in dir(self):
+            if not name.startswith(RECEIVE_PREFIX):
+                continue
+
+            handler = getattr(self, name)
+            if callable(handler):
+                self.message_handlers[name[len(RECEIVE_PREFIX) :]] = handler
+
         # create timer
         self.timer = self.create_timer(0, self.run)
 
@@ -157,6 +218,7 @@ class WebSocketClient(WorkerSafeTimer):
         """Callback when the connection is open."""
         logger.info("Websocket connected to server")
         self.retry = False
+        self.reconnect_delay = self.reconnect_interval
         self.on_connected()
 
     @safe
@@ -165,7 +227,8 @@ class WebSocketClient(WorkerSafeTimer):
 
         If the disconnection is not due to the end of the program, consider the
         connection has been lost. In that case, a reconnection will be
-        attempted within `reconnect_interval` seconds.
+        attempted within `reconnect_delay` seconds, which is doubled for the
+        next attempt.
 
         Args:
             code (int): Error code (often None).
@@ -187,9 +250,11 @@ class WebSocketClient(WorkerSafeTimer):
         self.retry = True
         self.on_connection_lost()
 
-        # attempt to reconnect
-        logger.warning("Trying to reconnect in %i s", self.reconnect_interval)
-        self.timer = self.create_timer(self.reconnect_interval, self.run)
+        # attempt to reconnect, and wait longer for the next attempt
+        delay = self.reconnect_delay
+        self.reconnect_delay = min(delay * 2, self.reconnect_interval_max)
+        logger.warning("Trying to reconnect in %i s", delay)
+        self.timer = self.create_timer(delay, self.run)
         self.timer.start()
 
     @safe
@@ -208,7 +273,7 @@ class WebSocketClient(WorkerSafeTimer):
         """
         # convert the message to an event object
         try:
-            event = json.loads(message)
+            event = json_loads(message)
 
         # if the message is not in JSON format, assume this is an error
         except json.JSONDecodeError:
@@ -225,13 +290,29 @@ class WebSocketClient(WorkerSafeTimer):
             logger.error("Event of no type received")
             return
 
-        # attempt to call the corresponding method
-        method_name = "receive_{}".format(message_type)
+        # get the corresponding method, methods set after initialization are
+        # looked up directly and added to the table
         try:
-            getattr(self, method_name)(event.get("data"))
+            handler = self.message_handlers[message_type]
 
-        except AttributeError:
+        except KeyError:
+            handler = getattr(self, RECEIVE_PREFIX + str(message_type), None)
+            if callable(handler):
+                self.message_handlers[message_type] = handler
+
+            # the attribute is not a method
+            else:
+                handler = None
+
+        # the type cannot be a key of the table
+        except TypeError:
+            handler = None
+
+        if handler is None:
             logger.error("Event of unknown type received '%s'", message_type)
+            return
+
+        handler(event.get("data"))
 
     @safe
     def on_error(self, error):
@@ -251,31 +332,70 @@ class WebSocketClient(WorkerSafeTimer):
         if self.stop.is_set():
             return
 
-        # the connection was refused
-        if isinstance(error, WebSocketBadStatusException):
-            raise AuthenticationError(
-                "Unable to connect to server with this user"
-            ) from error
-
-        # the server is unreachable
-        if isinstance(error, ConnectionRefusedError):
-            if self.retry:
-                logger.warning("Unable to talk to the server")
+        # get the method handling the class of the error, or one of its parent
+        # classes, in order
+        handler_name = self.ERROR_HANDLERS.get(type(error))
+        if handler_name is None:
+            for error_class, name in self.ERROR_HANDLERS.items():
+                if isinstance(error, error_class):
+                    handler_name = name
+                    break
+
+            # other unlisted reason
+            else:
+                logger.error("Websocket: %s", str(error))
                 return
 
-            raise NetworkError("Network error, unable to talk to the server") from error
+        getattr(self, handler_name)(error)
+
+    def handle_authentication_error(self, error):
+        """Handle an error when the connection was refused.
 
-        # the requested endpoint does not exist
-        if isinstance(error, ConnectionResetError):
-            raise ParameterError("Invalid endpoint to the server") from error
+        Args:
+            error (websocket.WebSocketBadStatusException): Error.
 
-        # connection closed by the server (see beginning of the method)
-        if isinstance(error, WebSocketConnectionClosedException):
-            # this case is handled by the on_close method
+        Raises:
+            AuthenticationError: Always.
+        """
+        raise AuthenticationError(
+            "Unable to connect to server with this user"
+        ) from error
+
+    def handle_network_error(self, error):
+        """Handle an error when the server is unreachable.
+
+        Args:
+            error (ConnectionRefusedError): Error.
+
+        Raises:
+            NetworkError: If the client was not trying to reconnect.
+        """
+        if self.retry:
+            logger.warning("Unable to talk to the server")
             return
 
-        # other unlisted reason
-        logger.error("Websocket: %s", str(error))
+        raise NetworkError("Network error, unable to talk to the server") from error
+
+    def handle_endpoint_error(self, error):
+        """Handle an error when the requested endpoint does not exist.
+
+        Args:
+            error (ConnectionResetError): Error.
+
+        Raises:
+            ParameterError: Always.
+        """
+        raise ParameterError("Invalid endpoint to the server") from error
+
+    def handle_closed_error(self, error):
+        """Handle an error when the connection is closed by the server.
+
+        This case is handled by the `on_close` method (see also the beginning
+        of `on_error`).
+
+        Args:
+            error (websocket.WebSocketConnectionClosedException): Error.
+        """
 
     def on_connected(self):
         """Custom callback when the connection is established with the server.
@@ -293,7 +413,7 @@ class WebSocketClient(WorkerSafeTimer):
     def send(self, message_type, data=None, *args, **kwargs):
         """Send data to the server.
 
-        Convert it to JSON string before sending.
+        Convert it to a compact JSON string before sending.
 
         Args:
             message_type (str): Type of the message.
@@ -307,7 +427,7 @@ class WebSocketClient(WorkerSafeTimer):
         if data is not None:
             content["data"] = data
 
-        return self.websocket.send(json.dumps(content), *args, **kwargs)
+        return self.websocket.send(json_dumps(content), *args, **kwargs)
 
     def abort(self):
         """Request to interrupt the connection.
@@ -341,13 +461,49 @@ class WebSocketClient(WorkerSafeTimer):
         self.websocket = WebSocketApp(
             self.server_url,
             header=self.header,
-            on_open=lambda ws: self.on_open(),
-            on_close=lambda ws, code, reason: self.on_close(code, reason),
-            on_message=lambda ws, message: self.on_message(message),
-            on_error=lambda ws, error: self.on_error(error),
+            on_open=self.on_websocket_open,
+            on_close=self.on_websocket_close,
+            on_message=self.on_websocket_message,
+            on_error=self.on_websocket_error,
         )
         self.websocket.run_forever()
 
+    def on_websocket_open(self, websocket):
+        """Adapt the open callback of the websocket to `on_open`.
+
+        Args:
+            websocket (websocket.WebSocketApp): WebSocket connection object.
+        """
+        self.on_open()
+
+    def on_websocket_close(self, websocket, code, reason):
+        """Adapt the close callback of the websocket to `on_close`.
+
+        Args:
+            websocket (websocket.WebSocketApp): WebSocket connection object.
+            code (int): Error code (often None).
+            reason (str): Reason of the closed connection (often None).
+        """
+        self.on_close(code, reason)
+
+    def on_websocket_message(self, websocket, message):
+        """Adapt the message callback of the websocket to `on_message`.
+
+        Args:
+            websocket (websocket.WebSocketApp): WebSocket connection object.
+            message (str): A JSON text of the event.
+        """
+        self.on_message(message)
+
+    def on_websocket_error(self, websocket, error):
+        """Adapt the error callback of the websocket to `on_error`.
+
+        Args:
+            websocket (websocket.WebSocketApp): WebSocket connection object.
+            error (BaseException): Class of the error.
+        """
+        self.on_error(error)
+
 
 class NotConnectedError(DakaraError):
     """Error raised when connection is missing."""
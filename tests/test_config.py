@@ -1,13 +1,15 @@
+import inspect
 import os
 from unittest import TestCase
-from unittest.mock import PropertyMock, patch
+from unittest.mock import ANY, Mock, PropertyMock, patch
 
 try:
-    from importlib.resources import path
+    from importlib.resources import as_file, files
 
 except ImportError:
-    from importlib_resources import path
+    from importlib_resources import as_file, files
 
+import yaml
 from environs import Env
 from path import Path
 from yaml.parser import ParserError
@@ -16,12 +18,18 @@ from dakara_base.config import (
     AutoEnv,
     Config,
     ConfigInvalidError,
+    ConfigLoader,
     ConfigNotFoundError,
     ConfigParseError,
+    cache_environment,
+    clear_config_cache,
     create_config_file,
     create_logger,
+    get_resource_path,
     set_loglevel,
+    strtobool,
 )
+from dakara_base.utils import create_url
 
 
 class AutoEnvTestCase(TestCase):
@@ -62,10 +70,107 @@ class AutoEnvTestCase(TestCase):
             with env.prefixed("PREFIX_"):
                 self.assertEqual(env.auto(str, "AAA"), "my_val")
 
+    def test_get_from_environ_signature(self):
+        """Test the overridden method of environs has the expected signature.
+
+        `AutoEnv._get_from_environ` mirrors a private method of environs,
+        which may change with new versions of the library.
+        """
+        self.assertListEqual(
+            list(inspect.signature(Env._get_from_environ).parameters),
+            ["self", "key", "default", "proxied"],
+        )
+
+        with patch.dict(os.environ, {"AAA": "my_val"}, clear=True):
+            self.assertTupleEqual(
+                Env()._get_from_environ("AAA", None), ("AAA", "my_val", None)
+            )
+
+    @patch("dakara_base.config.environ_snapshot", None)
+    def test_get_cached(self):
+        """Test to get a typed value from a snapshot of the environment."""
+        env = AutoEnv()
+
+        # take a snapshot of the environment
+        with patch.dict(os.environ, {"PREFIX_AAA": "5"}, clear=True):
+            cache_environment()
+
+        with patch.dict(os.environ, {"PREFIX_AAA": "9"}, clear=True):
+            with env.prefixed("PREFIX_"):
+                self.assertEqual(env.auto(int, "AAA"), 5)
+
+            # drop the snapshot
+            cache_environment(False)
+
+            with env.prefixed("PREFIX_"):
+                self.assertEqual(env.auto(int, "AAA"), 9)
+
+
+class ConfigLoaderTestCase(TestCase):
+    """Test the `ConfigLoader` class."""
+
+    def test_load(self):
+        """Test to load implicit types."""
+        content = yaml.load(
+            "\n".join(
+                [
+                    "default: &default",
+                    "  bool: yes",
+                    "  int: 42",
+                    "  float: 3.1416",
+                    "  nothing: ~",
+                    "other:",
+                    "  <<: *default",
+                    "  date: 2022-11-19",
+                ]
+            ),
+            Loader=ConfigLoader,
+        )
+
+        self.assertDictEqual(
+            content["other"],
+            {
+                "bool": True,
+                "int": 42,
+                "float": 3.1416,
+                "nothing": None,
+                "date": "2022-11-19",
+            },
+        )
+
+    def test_construct_config(self):
+        """Test to construct a config from nodes."""
+        node = yaml.compose(
+            "\n".join(
+                [
+                    "key: value",
+                    "sub:",
+                    "  subkey: 42",
+                    "  list:",
+                    "    - item: value",
+                ]
+            ),
+            Loader=ConfigLoader,
+        )
+        loader = ConfigLoader("")
+        config = loader.construct_config(node, Config("prefix"))
+        loader.dispose()
+
+        self.assertDictEqual(
+            config, {"key": "value", "sub": {"subkey": 42, "list": [{"item": "value"}]}}
+        )
+        self.assertIsInstance(config["sub"], Config)
+        self.assertEqual(config["sub"].prefix, "prefix_sub")
+        self.assertNotIsInstance(config["sub"]["list"][0], Config)
+
 
 class ConfigTestCase(TestCase):
     """Test the `Config` class."""
 
+    def setUp(self):
+        # make sure config files are parsed for each test
+        clear_config_cache()
+
     def test_return_env_var(self):
         """Test return var env when present."""
 
@@ -84,6 +189,81 @@ class ConfigTestCase(TestCase):
             self.assertEqual(config.get("server"), "url_from_env")
             self.assertEqual(config["server"], "url_from_env")
 
+    @patch("dakara_base.config.environ_snapshot", None)
+    def test_return_env_var_cached(self):
+        """Test return var env from a snapshot of the environment."""
+        config = Config("dakara", {"server": "url"})
+
+        # take a snapshot of the environment
+        with patch.dict(os.environ, {"DAKARA_SERVER": "url_from_env"}, clear=True):
+            cache_environment()
+
+        # return value from the snapshot
+        self.assertEqual(config["server"], "url_from_env")
+
+        # drop the snapshot
+        with patch.dict(os.environ, {}, clear=True):
+            cache_environment(False)
+
+            # return value from the config
+            self.assertEqual(config["server"], "url")
+
+    @patch("dakara_base.config.environ_snapshot", None)
+    def test_return_env_var_cached_typed(self):
+        """Test typed and untyped values come from the same snapshot."""
+        config = Config("dakara", {"port": 8000, "name": "file"})
+
+        # take a snapshot of the environment
+        with patch.dict(
+            os.environ, {"DAKARA_PORT": "5", "DAKARA_NAME": "env"}, clear=True
+        ):
+            cache_environment()
+
+        # change the environment after the snapshot
+        with patch.dict(os.environ, {"DAKARA_PORT": "9"}, clear=True):
+            # return values from the snapshot
+            self.assertEqual(config["port"], "5")
+            self.assertEqual(config.get("port", 0), 5)
+            self.assertEqual(config["name"], "env")
+            self.assertEqual(config.get("name", ""), "env")
+
+            # drop the snapshot
+            cache_environment(False)
+
+    @patch("dakara_base.config.environ_snapshot", None)
+    @patch.object(Config, "get_value_from_env", autospec=True)
+    def test_return_env_var_cached_memoized(self, mocked_get_value_from_env):
+        """Test values from a snapshot of the environment are memoized."""
+        mocked_get_value_from_env.return_value = "url_from_env"
+        config = Config("dakara", {"server": "url", "port": 8000})
+
+        # take a snapshot of the environment
+        with patch.dict(os.environ, {"DAKARA_SERVER": "url_from_env"}, clear=True):
+            cache_environment()
+
+        # get a value not overridden
+        self.assertEqual(config["port"], 8000)
+        mocked_get_value_from_env.assert_not_called()
+
+        # get the value several times
+        self.assertEqual(config["server"], "url_from_env")
+        self.assertEqual(config.get("server"), "url_from_env")
+
+        # assert the call
+        mocked_get_value_from_env.assert_called_once_with(config, "server", None)
+
+        # setting the value drops the memoized value
+        config["server"] = "other url"
+        self.assertEqual(config["server"], "url_from_env")
+        self.assertEqual(mocked_get_value_from_env.call_count, 2)
+
+    def test_get_env_name(self):
+        """Test to get the name of the environment variable of a key."""
+        config = Config("dakara")
+
+        self.assertEqual(config.get_env_name("server"), "DAKARA_SERVER")
+        self.assertDictEqual(config.env_names, {"server": "DAKARA_SERVER"})
+
     def test_create_from_dict(self):
         """Test the creation from existing dict."""
 
@@ -105,6 +285,88 @@ class ConfigTestCase(TestCase):
             self.assertEqual(config.get("server").get("url"), "url_from_env")
             self.assertEqual(config["server"]["url"], "url_from_env")
 
+    def test_create_from_dict_deep(self):
+        """Test the creation from existing deeply nested dict."""
+        config = Config("DAKARA", {"a": {"b": {"c": {"key": "value"}}}})
+
+        # Check child dicts were also converted with accumulated prefixes
+        self.assertIsInstance(config["a"]["b"]["c"], Config)
+        self.assertEqual(config["a"]["b"]["c"].prefix, "DAKARA_a_b_c")
+        self.assertEqual(config["a"]["b"]["c"]["key"], "value")
+
+    def test_interned_keys(self):
+        """Test string keys are interned."""
+        key = "".join(["ser", "ver"])
+        config = Config("DAKARA")
+        config[key] = "url"
+
+        self.assertIs(next(iter(config)), "server")
+
+    def test_contains(self):
+        """Test membership only considers stored keys."""
+        config = Config("DAKARA", {"key": "value"})
+
+        # Add a environment variable for a key not stored
+        with patch.dict(os.environ, {"DAKARA_OTHER": "value_from_env"}, clear=True):
+            self.assertIn("key", config)
+            self.assertNotIn("other", config)
+
+    def test_items_values(self):
+        """Test items and values are obtained from environment variables."""
+        config = Config("DAKARA", {"key": "value"})
+
+        # Add a environment variable with the same name
+        with patch.dict(os.environ, {"DAKARA_KEY": "value_from_env"}, clear=True):
+            self.assertListEqual(list(config.items()), [("key", "value_from_env")])
+            self.assertListEqual(list(config.values()), ["value_from_env"])
+
+    def test_unpack_copy(self):
+        """Test unpacked and copied configs use environment variables."""
+        config = Config("DAKARA", {"server": {"address": "a.com", "ssl": False}})
+
+        # Add a environment variable with the same name
+        with patch.dict(os.environ, {"DAKARA_SERVER_ADDRESS": "env.com"}, clear=True):
+            self.assertEqual(create_url(**config["server"]), "http://env.com")
+            self.assertDictEqual(
+                dict(config["server"]), {"address": "env.com", "ssl": False}
+            )
+            self.assertDictEqual(
+                {**config["server"]}, {"address": "env.com", "ssl": False}
+            )
+
+            # copy the config
+            server = config["server"].copy()
+            self.assertIsInstance(server, Config)
+            self.assertEqual(server.prefix, "DAKARA_server")
+            self.assertEqual(server["address"], "env.com")
+
+    def test_pop_setdefault_eq(self):
+        """Test mutating methods and comparisons use environment variables."""
+        # Add a environment variable with the same name
+        with patch.dict(os.environ, {"DAKARA_KEY": "value_from_env"}, clear=True):
+            config = Config("DAKARA", {"key": "value", "other": "value"})
+            self.assertEqual(config.pop("key"), "value_from_env")
+            self.assertNotIn("key", config)
+            self.assertEqual(config.pop("key", "default"), "default")
+            with self.assertRaises(KeyError):
+                config.pop("key")
+
+            config = Config("DAKARA", {"key": "value"})
+            self.assertTupleEqual(config.popitem(), ("key", "value_from_env"))
+            self.assertDictEqual(dict(config), {})
+
+            config = Config("DAKARA", {"key": "value"})
+            self.assertEqual(config.setdefault("key", "default"), "value_from_env")
+            self.assertEqual(config.setdefault("other", "default"), "default")
+            self.assertEqual(config["other"], "default")
+
+            config = Config("DAKARA", {"key": "value"})
+            self.assertTrue(config == {"key": "value_from_env"})
+            self.assertFalse(config != {"key": "value_from_env"})
+            self.assertFalse(config == {"key": "value"})
+            self.assertTrue(config != {"key": "value"})
+            self.assertFalse(config == ["key"])
+
     def test_cast(self):
         """Test to cast values when getting them."""
         config = Config("DAKARA")
@@ -140,13 +402,19 @@ class ConfigTestCase(TestCase):
         config.set_debug()
         self.assertEqual(config["loglevel"], "DEBUG")
 
-    @patch.object(Config, "check_mandatory_key")
-    def test_check_madatory_keys(self, mocked_check_mandatory_key):
+    def test_check_madatory_keys(self):
         """Test to check a list of keys."""
-        config = Config("DAKARA")
-        config.check_mandatory_keys(["key"])
+        config = Config("DAKARA", {"key": "value", "other": "value"})
+        config.check_mandatory_keys(["key", "other"])
 
-        mocked_check_mandatory_key.assert_called_once_with("key")
+    def test_check_madatory_keys_missing(self):
+        """Test to check a list of keys with several missing keys."""
+        config = Config("DAKARA", {"key": "value"})
+
+        with self.assertRaisesRegex(
+            ConfigInvalidError, "Invalid config file, missing 'not-here', 'other'"
+        ):
+            config.check_mandatory_keys(["other", "key", "not-here"])
 
     def test_check_madatory_key_missing(self):
         """Test to check config without a required key."""
@@ -163,11 +431,13 @@ class ConfigTestCase(TestCase):
 
         # call the method
         with self.assertLogs("dakara_base.config", "DEBUG") as logger:
-            with path("tests.resources", "config.yaml") as file:
+            with as_file(files("tests.resources") / "config.yaml") as file:
                 config.load_file(Path(file))
 
         # assert the result
         self.assertEqual(config["key"]["subkey"], "value")
+        self.assertIsInstance(config["key"], Config)
+        self.assertEqual(config["key"].prefix, "DAKARA_key")
 
         # assert the effect on logs
         self.assertListEqual(
@@ -175,6 +445,51 @@ class ConfigTestCase(TestCase):
             ["INFO:dakara_base.config:Loading config file '{}'".format(Path(file))],
         )
 
+    def test_load_file_cached(self):
+        """Test to load the same config file twice parses it only once."""
+        config = Config("DAKARA")
+
+        # call the method twice
+        with self.assertLogs("dakara_base.config", "DEBUG"):
+            with as_file(files("tests.resources") / "config.yaml") as file:
+                with patch(
+                    "dakara_base.config.yaml.compose", wraps=yaml.compose
+                ) as mocked_compose:
+                    config.load_file(Path(file))
+                    config["key"]["subkey"] = "other value"
+                    config.load_file(Path(file))
+
+        # assert the result
+        self.assertEqual(config["key"]["subkey"], "value")
+
+        # assert the call
+        mocked_compose.assert_called_once_with(ANY, Loader=ANY)
+
+    def test_load_file_cached_modified(self):
+        """Test to load a modified config file keeps only its last version."""
+        config = Config("DAKARA")
+        config_cache = {}
+
+        # call the method twice, with a file modified in between
+        with self.assertLogs("dakara_base.config", "DEBUG"):
+            with as_file(files("tests.resources") / "config.yaml") as file:
+                with patch(
+                    "dakara_base.config.yaml.compose", wraps=yaml.compose
+                ) as mocked_compose, patch(
+                    "dakara_base.config.config_cache", config_cache
+                ), patch.object(
+                    Path, "stat", autospec=True
+                ) as mocked_stat:
+                    mocked_stat.return_value = Mock(st_mtime_ns=1, st_size=10)
+                    config.load_file(Path(file))
+
+                    mocked_stat.return_value = Mock(st_mtime_ns=2, st_size=10)
+                    config.load_file(Path(file))
+
+        # assert the call
+        self.assertEqual(mocked_compose.call_count, 2)
+        self.assertEqual(len(config_cache), 1)
+
     def test_load_file_fail_not_found(self):
         """Test to load a not found config file."""
         config = Config("DAKARA")
@@ -184,28 +499,78 @@ class ConfigTestCase(TestCase):
             with self.assertRaisesRegex(ConfigNotFoundError, "No config file found"):
                 config.load_file(Path("nowhere"))
 
-    @patch("dakara_base.config.yaml.safe_load", autospec=True)
-    def test_load_file_fail_parser_error(self, mocked_safe_load):
+    @patch("dakara_base.config.yaml.compose", autospec=True)
+    def test_load_file_fail_parser_error(self, mocked_compose):
         """Test to load an invalid config file."""
         # mock the call to yaml
-        mocked_safe_load.side_effect = ParserError("parser error")
+        mocked_compose.side_effect = ParserError("parser error")
 
         config = Config("DAKARA")
 
         # call the method
         with self.assertLogs("dakara_base.config", "DEBUG"):
-            with path("tests.resources", "config.yaml") as file:
+            with as_file(files("tests.resources") / "config.yaml") as file:
                 with self.assertRaisesRegex(
                     ConfigParseError, "Unable to parse config file"
                 ):
                     config.load_file(Path(file))
 
+    @patch("dakara_base.config.yaml.compose", autospec=True)
+    def test_load_file_fail_not_mapping(self, mocked_compose):
+        """Test to load a config file without a mapping."""
+        # mock the call to yaml
+        mocked_compose.return_value = None
+
+        config = Config("DAKARA")
+
+        # call the method
+        with self.assertLogs("dakara_base.config", "DEBUG"):
+            with as_file(files("tests.resources") / "config.yaml") as file:
+                with self.assertRaisesRegex(
+                    ConfigParseError, "Config file must contain a mapping"
+                ):
+                    config.load_file(Path(file))
+
+    def test_load_file_fail_construct(self):
+        """Test to load a config file that cannot be constructed."""
+        node = yaml.compose("a: 1\nb: !unknown x", Loader=ConfigLoader)
+        config = Config("DAKARA", {"keep": 1})
+
+        # call the method
+        with self.assertLogs("dakara_base.config", "DEBUG"):
+            with as_file(files("tests.resources") / "config.yaml") as file:
+                with patch(
+                    "dakara_base.config.yaml.compose", autospec=True
+                ) as mocked_compose:
+                    mocked_compose.return_value = node
+
+                    with self.assertRaisesRegex(
+                        ConfigParseError, "Unable to parse config file"
+                    ):
+                        config.load_file(Path(file))
+
+        # assert the config is unchanged
+        self.assertDictEqual(config, {"keep": 1})
+
+    @patch("dakara_base.config.cache_environment", autospec=True)
+    def test_load_file_cache_env(self, mocked_cache_environment):
+        """Test to load a config file and take a snapshot of the environment."""
+        config = Config("DAKARA")
+
+        # call the method
+        with self.assertLogs("dakara_base.config", "DEBUG"):
+            with as_file(files("tests.resources") / "config.yaml") as file:
+                config.load_file(Path(file), cache_env=True)
+
+        # assert the call
+        mocked_cache_environment.assert_called_with()
+
     def test_config_env(self):
         """Test to load config and get value from environment."""
         config = Config("DAKARA")
 
         with self.assertLogs("dakara_base.config", "DEBUG"):
-            with path("tests.resources", "config.yaml") as file:
+            with as_file(files("tests.resources") / "config.yaml") as file:
                 config.load_file(Path(file))
 
         self.assertNotEqual(config.get("key").get("subkey"), "myvalue")
@@ -216,11 +581,13 @@ class ConfigTestCase(TestCase):
 
 @patch("dakara_base.config.LOG_FORMAT", "my format")
 @patch("dakara_base.config.LOG_LEVEL", "my level")
+@patch("dakara_base.config.logger_settings", None)
+@patch("dakara_base.config.logger_level", None)
 class CreateLoggerTestCase(TestCase):
     """Test the `create_logger` function."""
 
     @patch("dakara_base.progress_bar.progressbar.streams.wrap_stderr")
-    @patch("dakara_base.config.coloredlogs.install", autospec=True)
+    @patch("coloredlogs.install", autospec=True)
     def test_normal(self, mocked_install, mocked_wrap_stderr):
         """Test to call the method normally."""
         # call the method
@@ -231,7 +598,7 @@ class CreateLoggerTestCase(TestCase):
         mocked_wrap_stderr.assert_not_called()
 
     @patch("dakara_base.progress_bar.progressbar.streams.wrap_stderr")
-    @patch("dakara_base.config.coloredlogs.install", autospec=True)
+    @patch("coloredlogs.install", autospec=True)
     def test_wrap(self, mocked_install, mocked_wrap_stderr):
         """Test to call the method and request to wrap stderr."""
         # call the method
@@ -242,7 +609,7 @@ class CreateLoggerTestCase(TestCase):
         mocked_wrap_stderr.assert_called_with()
 
     @patch("dakara_base.progress_bar.progressbar.streams.wrap_stderr")
-    @patch("dakara_base.config.coloredlogs.install", autospec=True)
+    @patch("coloredlogs.install", autospec=True)
     def test_custom(self, mocked_install, mocked_wrap_stderr):
         """Test to call the method with custom format and level."""
         # call the method
@@ -256,11 +623,40 @@ class CreateLoggerTestCase(TestCase):
         )
         mocked_wrap_stderr.assert_not_called()
 
+    @patch("dakara_base.progress_bar.progressbar.streams.wrap_stderr")
+    @patch("coloredlogs.install", autospec=True)
+    def test_twice(self, mocked_install, mocked_wrap_stderr):
+        """Test to call the method twice with the same settings."""
+        # call the method
+        create_logger(wrap=True)
+        create_logger(wrap=True)
+
+        # assert the call
+        mocked_install.assert_called_once_with(fmt="my format", level="my level")
+        mocked_wrap_stderr.assert_called_once_with()
+
+    @patch("coloredlogs.set_level", autospec=True)
+    @patch("dakara_base.progress_bar.progressbar.streams.wrap_stderr")
+    @patch("coloredlogs.install", autospec=True)
+    def test_twice_level_changed(
+        self, mocked_install, mocked_wrap_stderr, mocked_set_level
+    ):
+        """Test to call the method twice after the level has been changed."""
+        # call the method
+        create_logger()
+        set_loglevel({"loglevel": "DEBUG"})
+        create_logger()
+
+        # assert the call
+        self.assertEqual(mocked_install.call_count, 2)
+        mocked_install.assert_called_with(fmt="my format", level="my level")
 
+
+@patch("dakara_base.config.logger_level", None)
 class SetLoglevelTestCase(TestCase):
     """Test the `set_loglevel` function."""
 
-    @patch("dakara_base.config.coloredlogs.set_level", autospec=True)
+    @patch("coloredlogs.set_level", autospec=True)
     def test_configure_logger(self, mocked_set_level):
         """Test to configure the logger."""
         # call the method
@@ -269,7 +665,7 @@ class SetLoglevelTestCase(TestCase):
         # assert the result
         mocked_set_level.assert_called_with("DEBUG")
 
-    @patch("dakara_base.config.coloredlogs.set_level", autospec=True)
+    @patch("coloredlogs.set_level", autospec=True)
     def test_configure_logger_no_level(self, mocked_set_level):
         """Test to configure the logger with no log level."""
         # call the method
@@ -278,6 +674,59 @@ class SetLoglevelTestCase(TestCase):
         # assert the result
         mocked_set_level.assert_called_with("INFO")
 
+    @patch("coloredlogs.set_level", autospec=True)
+    def test_configure_logger_unchanged(self, mocked_set_level):
+        """Test to configure the logger twice with the same log level."""
+        # call the method
+        set_loglevel({"loglevel": "DEBUG"})
+        set_loglevel({"loglevel": "DEBUG"})
+
+        # assert the result
+        mocked_set_level.assert_called_once_with("DEBUG")
+
+
+class StrtoboolTestCase(TestCase):
+    """Test the `strtobool` function."""
+
+    def test_true(self):
+        """Test to convert true values."""
+        for value in ["y", "yes", "t", "true", "on", "1", "Yes", "TRUE"]:
+            with self.subTest(value=value):
+                self.assertIs(strtobool(value), True)
+
+    def test_false(self):
+        """Test to convert false values."""
+        for value in ["n", "no", "f", "false", "off", "0", "No", "FALSE"]:
+            with self.subTest(value=value):
+                self.assertIs(strtobool(value), False)
+
+    def test_invalid(self):
+        """Test to convert an invalid value."""
+        with self.assertRaisesRegex(ValueError, "Invalid truth value 'maybe'"):
+            strtobool("maybe")
+
+
+class GetResourcePathTestCase(TestCase):
+    """Test the `get_resource_path` function."""
+
+    def setUp(self):
+        # make sure resources are searched for each test
+        get_resource_path.cache_clear()
+
+    def test_get(self):
+        """Test to get the path of a resource file twice."""
+        with patch("dakara_base.config.files", wraps=files) as mocked_files:
+            file = get_resource_path("tests.resources", "config.yaml")
+            file_again = get_resource_path("tests.resources", "config.yaml")
+
+        # assert the result
+        self.assertIsInstance(file, Path)
+        self.assertTrue(file.exists())
+        self.assertEqual(file, file_again)
+
+        # assert the call
+        mocked_files.assert_called_once_with("tests.resources")
+
 
 @patch.object(Path, "copyfile")
 @patch.object(Path, "exists")
@@ -287,14 +736,15 @@ class SetLoglevelTestCase(TestCase):
     new_callable=PropertyMock(return_value=Path("path") / "to" / "directory"),
 )
 @patch(
-    "dakara_base.config.path",
+    "dakara_base.config.get_resource_path",
+    return_value=Path("path") / "to" / "resources" / "config.yaml",
 )
 class CreateConfigFileTestCase(TestCase):
     """Test the config file creator."""
 
     def test_create_empty(
         self,
-        mocked_path,
+        mocked_get_resource_path,
         mocked_user_config_dir,
         mocked_mkdir_p,
         mocked_exists,
@@ -309,7 +759,7 @@ class CreateConfigFileTestCase(TestCase):
             create_config_file("module.resources", "config.yaml")
 
         # assert the call
-        mocked_path.assert_called_with("module.resources", "config.yaml")
+        mocked_get_resource_path.assert_called_with("module.resources", "config.yaml")
         mocked_mkdir_p.assert_called_with()
         mocked_exists.assert_called_with()
         mocked_copyfile.assert_called_with(
@@ -330,7 +780,7 @@ class CreateConfigFileTestCase(TestCase):
     def test_create_existing_no(
         self,
         mocked_input,
-        mocked_path,
+        mocked_get_resource_path,
         mocked_user_config_dir,
         mocked_mkdir_p,
         mocked_exists,
@@ -356,7 +806,7 @@ class CreateConfigFileTestCase(TestCase):
     def test_create_existing_invalid_input(
         self,
         mocked_input,
-        mocked_path,
+        mocked_get_resource_path,
         mocked_user_config_dir,
         mocked_mkdir_p,
         mocked_exists,
@@ -377,7 +827,7 @@ class CreateConfigFileTestCase(TestCase):
     def test_create_existing_force(
         self,
         mocked_input,
-        mocked_path,
+        mocked_get_resource_path,
         mocked_user_config_dir,
         mocked_mkdir_p,
         mocked_exists,
@@ -1,4 +1,5 @@
-from unittest import TestCase
+import sys
+from unittest import TestCase, skipIf
 
 from path import Path
 
@@ -18,3 +19,9 @@ class AppDirsPathTestCase(TestCase):
         self.assertIsInstance(appdirs.user_log_dir, Path)
         self.assertIsInstance(appdirs.user_runtime_dir, Path)
         self.assertIsInstance(appdirs.user_state_dir, Path)
+
+    @skipIf(sys.version_info < (3, 8), "Properties are not cached for Python 3.7")
+    def test_properties_cached(self):
+        appdirs = AppDirsPath("appname", "authorname")
+
+        self.assertIs(appdirs.user_config_dir, appdirs.user_config_dir)
@@ -25,6 +25,76 @@ class GenerateExceptionHandleTestCase(TestCase):
         self.assertIsInstance(cm.exception, MyError)
         self.assertIsInstance(cm.exception, DakaraHandledError)
 
+    def test_handler_decorator(self):
+        """Test to generate and use an exception handler as a decorator"""
+
+        class MyError(Exception):
+            pass
+
+        handler = generate_exception_handler(MyError, "handler message")
+
+        @handler()
+        def function():
+            raise MyError("initial message")
+
+        with self.assertRaisesRegex(MyError, r"initial message\nhandler message") as cm:
+            function()
+
+        self.assertIsInstance(cm.exception, DakaraHandledError)
+
+    def test_handler_list(self):
+        """Test to generate and use an exception handler for several classes"""
+
+        class MyError(Exception):
+            pass
+
+        class MyOtherError(Exception):
+            pass
+
+        handler = generate_exception_handler([MyError, MyOtherError], "message")
+
+        with self.assertRaisesRegex(MyOtherError, r"initial message\nmessage") as cm:
+            with handler():
+                raise MyOtherError("initial message")
+
+        self.assertIsInstance(cm.exception, DakaraHandledError)
+
+    def test_handler_cached(self):
+        """Test to generate the same exception handler twice"""
+
+        class MyError(Exception):
+            pass
+
+        handler = generate_exception_handler([MyError], "handler message")
+        handler_again = generate_exception_handler([MyError], "handler message")
+
+        self.assertIs(handler, handler_again)
+
+        errors = []
+        for _ in range(2):
+            try:
+                with handler():
+                    raise MyError("initial message")
+
+            except MyError as error:
+                errors.append(error)
+
+        self.assertIs(type(errors[0]), type(errors[1]))
+
+    def test_handler_other_error(self):
+        """Test an exception handler lets other exceptions pass"""
+
+        class MyError(Exception):
+            pass
+
+        handler = generate_exception_handler(MyError, "handler message")
+
+        with self.assertRaisesRegex(ValueError, r"^initial message$") as cm:
+            with handler():
+                raise ValueError("initial message")
+
+        self.assertNotIsInstance(cm.exception, DakaraHandledError)
+
 
 class HandleAllExceptionsTestCase(TestCase):
     def test_normal_exit(self):
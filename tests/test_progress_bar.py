@@ -3,7 +3,7 @@ import sys
 from contextlib import contextmanager
 from io import StringIO
 from unittest import TestCase
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import progressbar
 
@@ -40,8 +40,69 @@ class ShrinkablaTextWidgetTestCase(TestCase):
         result = widget(progress, data)
 
         # assert the result
-        self.assertEqual(len(result), 10)
-        self.assertEqual(result, "som...here")
+        self.assertEqual(len(result), 8)
+        self.assertEqual(result, "so...ere")
+
+    def test_cached(self):
+        """Test the text is computed again only when the terminal is resized."""
+        # prepare mock objects
+        progress = MagicMock()
+        progress.term_width = 40
+        data = MagicMock()
+
+        # create the widget and update it
+        widget = progress_bar.ShrinkableTextWidget("some text here")
+        result_first = widget(progress, data)
+        with patch.object(widget, "create_output") as mocked_create_output:
+            result_second = widget(progress, data)
+
+        # assert the result
+        self.assertEqual(result_first, "so...ere")
+        self.assertIs(result_second, result_first)
+
+        # assert the call
+        mocked_create_output.assert_not_called()
+
+    def test_cached_width(self):
+        """Test the text is created only once for a given width."""
+        # prepare mock objects
+        progress = MagicMock()
+        progress.term_width = 40
+        data = MagicMock()
+
+        # create the widget and update it
+        widget = progress_bar.ShrinkableTextWidget("some text here")
+        with patch.object(
+            widget, "create_output", wraps=widget.create_output
+        ) as mocked_create_output:
+            widget(progress, data)
+            progress.term_width = 80
+            widget(progress, data)
+            progress.term_width = 40
+            result = widget(progress, data)
+
+        # assert the result
+        self.assertEqual(result, "so...ere")
+
+        # assert the call
+        self.assertEqual(mocked_create_output.call_count, 2)
+
+    def test_width_quantized(self):
+        """Test the width is rounded down to a multiple of the step."""
+        # prepare mock objects
+        progress = MagicMock()
+        data = MagicMock()
+
+        # create the widget and update it
+        widget = progress_bar.ShrinkableTextWidget("some text here")
+        progress.term_width = 72
+        result_rounded = widget(progress, data)
+        progress.term_width = 12
+        result_min = widget(progress, data)
+
+        # assert the result
+        self.assertEqual(result_rounded, "some text here  ")
+        self.assertEqual(result_min, "so...ere")
 
     def test_too_short(self):
         """Test a too short case."""
@@ -113,6 +174,28 @@ class ProgressBarTestCase(TestCase):
             ],
         )
 
+    def test_min_poll_interval(self):
+        """Test a bar is redrawn at a limited rate by default."""
+        # call the bar
+        with patch(
+            "dakara_base.progress_bar.progressbar.ProgressBar",
+            wraps=progressbar.ProgressBar,
+        ) as mocked_progress_bar:
+            with StringIO() as file:
+                for _ in progress_bar.progress_bar(range(1), fd=file):
+                    pass
+
+                for _ in progress_bar.progress_bar(
+                    range(1), fd=file, min_poll_interval=0.1
+                ):
+                    pass
+
+        # assert the calls
+        mocked_progress_bar.assert_any_call(
+            widgets=ANY, fd=ANY, min_poll_interval=progress_bar.MIN_POLL_INTERVAL
+        )
+        mocked_progress_bar.assert_any_call(widgets=ANY, fd=ANY, min_poll_interval=0.1)
+
     def test_stderr_on_no_exception(self):
         """Test to check stderr is not captured if no exceptions occur."""
         stderr = StringIO()
@@ -217,11 +300,12 @@ class NullBarTestCase(TestCase):
         # call the bar
         with self.assertLogs("dakara_base.progress_bar") as logger:
             self.logger.info("start bar")
-            for _ in progress_bar.null_bar(range(1), text="some text here"):
-                pass
-
+            items = list(progress_bar.null_bar(range(2), text="some text here"))
             self.logger.info("end bar")
 
+        # assert the items
+        self.assertListEqual(items, [0, 1])
+
         # assert the logs
         self.assertListEqual(
             logger.output,
@@ -1,7 +1,13 @@
 from unittest import TestCase
 from unittest.mock import patch
+from urllib.parse import urlunsplit
 
-from dakara_base.utils import URLParameterError, create_url, truncate_message
+from dakara_base.utils import (
+    URLParameterError,
+    create_url,
+    create_url_cached,
+    truncate_message,
+)
 
 
 class TruncateMessageTestCase(TestCase):
@@ -23,6 +29,13 @@ class TruncateMessageTestCase(TestCase):
         self.assertLessEqual(len(message_displayed), 5)
         self.assertEqual(message_displayed, "fe...")
 
+    def test_long_message_blank(self):
+        """Test a long message is cut without blank before the ellipsis."""
+        message = " few characters"
+        message_displayed = truncate_message(message, limit=8)
+
+        self.assertEqual(message_displayed, " few...")
+
     def test_too_short_limit(self):
         """Test a too short limit.
 
@@ -39,6 +52,10 @@ class TruncateMessageTestCase(TestCase):
 class CreateUrlTestCase(TestCase):
     """Test the URL creator helper."""
 
+    def setUp(self):
+        # make sure URLs are created for each test
+        create_url_cached.cache_clear()
+
     def test_url(self):
         """Test to create URL directly with provided URL."""
         url = create_url(url="http://www.example.com", host="www.other.com")
@@ -81,14 +98,101 @@ class CreateUrlTestCase(TestCase):
         url = create_url(address="www.example.com:8000", scheme_no_ssl="http")
         self.assertEqual(url, "http://www.example.com:8000")
 
+    def test_address_ipv6(self):
+        """Test to create URL with provided address containing IPv6 host."""
+        url = create_url(address="[::1]", scheme_no_ssl="http")
+        self.assertEqual(url, "http://[::1]")
+
+    def test_address_ipv6_port(self):
+        """Test to create URL with provided address containing IPv6 host and port."""
+        url = create_url(address="[::1]:8000", scheme_no_ssl="http")
+        self.assertEqual(url, "http://[::1]:8000")
+
+    def test_address_ipv6_no_brackets(self):
+        """Test to create URL with provided address containing bare IPv6 host."""
+        for address in ["fe80::1", "[fe80::1"]:
+            with self.subTest(address=address):
+                with self.assertRaisesRegex(URLParameterError, "invalid address"):
+                    create_url(address=address)
+
     def test_nothing(self):
         """Test to create URL when nothing is provided."""
         with self.assertRaises(URLParameterError):
             create_url()
 
-    @patch("dakara_base.utils.furl", autospec=True)
-    def test_invalid_furl(self, mocked_furl):
-        """Test to create URL with invalid arguments for furl."""
-        mocked_furl.side_effect = ValueError("error")
+    def test_url_path_slashes(self):
+        """Test to create URL directly with provided URL and path with slashes."""
+        url = create_url(url="http://www.example.com/api/", path="/resource/")
+        self.assertEqual(url, "http://www.example.com/api/resource/")
+
+    def test_host_port_default(self):
+        """Test to create URL with provided host and default port."""
+        url = create_url(host="www.example.com", port=443, ssl=True)
+        self.assertEqual(url, "https://www.example.com")
+
+    def test_invalid_port(self):
+        """Test to create URL with invalid port."""
+        for port in ["abc", "", 0, 70000]:
+            with self.subTest(port=port):
+                with self.assertRaisesRegex(URLParameterError, "invalid port"):
+                    create_url(host="www.example.com", port=port)
+
+    def test_invalid_port_unhashable(self):
+        """Test to create URL with invalid unhashable port."""
+        with self.assertRaisesRegex(URLParameterError, r"invalid port '\[1\]'"):
+            create_url(host="www.example.com", port=[1])
+
+    @patch("dakara_base.utils.urlunsplit", autospec=True)
+    def test_error_not_repeated(self, mocked_urlunsplit):
+        """Test an error when creating an URL is raised at once."""
+        mocked_urlunsplit.side_effect = TypeError("error")
+
+        with self.assertRaisesRegex(TypeError, "error"):
+            create_url(host="www.example.com")
+
+        mocked_urlunsplit.assert_called_once()
+
+    def test_invalid_host(self):
+        """Test to create URL with invalid host."""
+        for host in ["www.example.com/evil", "a b", "a@b", "a?b", "a#b", "::1"]:
+            with self.subTest(host=host):
+                with self.assertRaisesRegex(URLParameterError, "invalid host"):
+                    create_url(host=host, port=8000)
+
+    def test_path_encoded(self):
+        """Test to create URL with a path to encode."""
+        for path, expected in [
+            ("a b/", "/a%20b/"),
+            ("a?b", "/a%3Fb"),
+            ("a#b", "/a%23b"),
+            ("a%20b", "/a%20b"),
+            ("100%", "/100%25"),
+            ("é/", "/%C3%A9/"),
+            ("a=b&c:d", "/a=b&c:d"),
+        ]:
+            with self.subTest(path=path):
+                self.assertEqual(
+                    create_url(host="www.example.com", path=path),
+                    "http://www.example.com" + expected,
+                )
+                self.assertEqual(
+                    create_url(url="http://www.example.com", path=path),
+                    "http://www.example.com" + expected,
+                )
+
+    def test_invalid_url(self):
+        """Test to create URL directly with invalid provided URL."""
         with self.assertRaises(URLParameterError):
-            create_url(host="www.example.com", scheme_no_ssl="http")
+            create_url(url="http://[www.example.com")
+
+    @patch("dakara_base.utils.urlunsplit", wraps=urlunsplit)
+    def test_cached(self, mocked_urlunsplit):
+        """Test to create the same URL twice creates it only once."""
+        url_first = create_url(host="www.example.com", scheme_no_ssl="http")
+        url_second = create_url(
+            host="www.example.com", scheme_no_ssl="http", extra="value"
+        )
+
+        self.assertEqual(url_first, "http://www.example.com")
+        self.assertEqual(url_second, "http://www.example.com")
+        mocked_urlunsplit.assert_called_once()
@@ -2,7 +2,7 @@ import json
 from queue import Queue
 from threading import Event
 from unittest import TestCase
-from unittest.mock import ANY, MagicMock, patch
+from unittest.mock import ANY, MagicMock, Mock, patch
 
 from websocket import WebSocketBadStatusException, WebSocketConnectionClosedException
 
@@ -15,6 +15,9 @@ from dakara_base.websocket_client import (
     connected,
 )
 
+# attributes of the websocket object used by the client
+WEBSOCKET_SPEC = ["send", "close", "sock", "run_forever"]
+
 
 class ConnectedTestCase(TestCase):
     """Test the `connected` decorator."""
@@ -55,22 +58,21 @@ class ConnectedTestCase(TestCase):
 class WebSocketClientTestCase(TestCase):
     """Test the WebSocket connection with the server."""
 
-    def setUp(self):
-        # create a mock websocket
-        self.websocket = MagicMock()
-
+    @classmethod
+    def setUpClass(cls):
         # create a server URL
-        self.url = "ws://www.example.com"
+        cls.url = "ws://www.example.com"
 
         # create a server WS endpoint URL
-        self.url_ws = "ws://www.example.com/ws/"
+        cls.url_ws = "ws://www.example.com/ws/"
 
         # create token header
-        self.header = {"token": "token"}
+        cls.header = {"token": "token"}
 
         # create a reconnect interval
-        self.reconnect_interval = 1
+        cls.reconnect_interval = 1
 
+    def setUp(self):
         # create stop event and errors queue
         self.stop = Event()
         self.errors = Queue()
@@ -86,7 +88,8 @@ class WebSocketClientTestCase(TestCase):
 
     def set_websocket(self):
         """Set the websocket object to a mock."""
-        self.client.websocket = MagicMock()
+        self.client.websocket = Mock(spec=WEBSOCKET_SPEC)
+        self.client.websocket.sock = Mock(spec=["abort"])
 
     @patch.object(WebSocketClient, "set_default_callbacks", autospec=True)
     def test_init_worker(self, mocked_set_default_callbacks):
@@ -117,37 +120,31 @@ class WebSocketClientTestCase(TestCase):
         # post assert the callback is now set
         self.assertIs(self.client.callbacks.get("test"), callback)
 
+    @patch("dakara_base.websocket_client.logger")
     @patch.object(WebSocketClient, "abort", autospec=True)
-    def test_exit_worker(self, mocked_abort):
+    def test_exit_worker(self, mocked_abort, mocked_logger):
         """Test to exit the worker."""
         # call the method
-        with self.assertLogs("dakara_base.websocket_client", "DEBUG") as logger:
-            self.client.exit_worker()
+        self.client.exit_worker()
 
         # assert the effect on logger
-        self.assertListEqual(
-            logger.output,
-            ["DEBUG:dakara_base.websocket_client:Aborting websocket connection"],
-        )
+        mocked_logger.debug.assert_called_once_with("Aborting websocket connection")
 
         # assert the call
         mocked_abort.assert_called_with(self.client)
 
+    @patch("dakara_base.websocket_client.logger")
     @patch.object(WebSocketClient, "on_connected", autospec=True)
-    def test_on_open(self, mocked_on_connected):
+    def test_on_open(self, mocked_on_connected, mocked_logger):
         """Test the callback on connection open."""
         # call the method
-        with self.assertLogs("dakara_base.websocket_client", "DEBUG") as logger:
-            self.client.on_open()
+        self.client.on_open()
 
         # assert the effect
         self.assertFalse(self.client.retry)
 
         # assert the effect on logger
-        self.assertListEqual(
-            logger.output,
-            ["INFO:dakara_base.websocket_client:Websocket connected to server"],
-        )
+        mocked_logger.info.assert_called_once_with("Websocket connected to server")
 
         # assert the call
         mocked_on_connected.assert_called_with(self.client)
@@ -220,6 +217,29 @@ class WebSocketClientTestCase(TestCase):
         mocked_create_timer.return_value.start.assert_called_with()
         mocked_on_connection_lost.assert_called_with(self.client)
 
+    @patch.object(WebSocketClient, "create_timer", autospec=True)
+    @patch.object(WebSocketClient, "on_connection_lost", autospec=True)
+    @patch.object(WebSocketClient, "on_connected", autospec=True)
+    def test_on_close_retry_backoff(
+        self, mocked_on_connected, mocked_on_connection_lost, mocked_create_timer
+    ):
+        """Test the delay between reconnection attempts increases."""
+        self.client.reconnect_interval_max = 5
+
+        # call the method several times
+        with self.assertLogs("dakara_base.websocket_client", "DEBUG"):
+            for _ in range(5):
+                self.client.on_close(None, None)
+
+            self.client.on_open()
+            self.client.on_close(None, None)
+
+        # assert the different calls
+        self.assertListEqual(
+            [args[1] for args, _ in mocked_create_timer.call_args_list],
+            [1, 2, 4, 5, 5, 1],
+        )
+
     @patch.object(WebSocketClient, "receive_dummy", create=True)
     def test_on_message_successful(self, mocked_receive_dummy):
         """Test a normal use of the on message method."""
@@ -232,6 +252,30 @@ class WebSocketClientTestCase(TestCase):
         # assert the dummy method has been called
         mocked_receive_dummy.assert_called_with(content)
 
+        # assert the method has been added to the handlers
+        self.assertIs(self.client.message_handlers["dummy"], mocked_receive_dummy)
+
+    def test_on_message_successful_handler(self):
+        """Test the on message method with a method defined in a subclass."""
+        event = '{"type": "dummy", "data": "data"}'
+        content = "data"
+        mocked_receive_dummy = MagicMock()
+
+        class MyWebSocketClient(WebSocketClient):
+            def receive_dummy(self, data):
+                mocked_receive_dummy(data)
+
+        client = MyWebSocketClient(self.stop, self.errors, {"url": self.url})
+
+        # pre assert
+        self.assertEqual(client.message_handlers, {"dummy": client.receive_dummy})
+
+        # call the method
+        client.on_message(event)
+
+        # assert the dummy method has been called
+        mocked_receive_dummy.assert_called_with(content)
+
     def test_on_message_failed_json(self):
         """Test the on message method when event is not a JSON string."""
         event = "definitely not a JSON string"
@@ -266,6 +310,47 @@ class WebSocketClientTestCase(TestCase):
             ],
         )
 
+    def test_on_message_failed_type_invalid(self):
+        """Test the on message method when event has an invalid type."""
+        event = '{"type": ["dummy"], "data": "data"}'
+
+        # call the method
+        with self.assertLogs("dakara_base.websocket_client", "DEBUG") as logger:
+            self.client.on_message(event)
+
+        # assert the effect on logger
+        self.assertListEqual(
+            logger.output,
+            [
+                "ERROR:dakara_base.websocket_client:"
+                "Event of unknown type received '['dummy']'"
+            ],
+        )
+
+    def test_on_message_failed_type_not_callable(self):
+        """Test the on message method when event type matches an attribute."""
+        self.client.receive_value = "value"
+
+        for message_type in ["handlers", "value"]:
+            with self.subTest(message_type=message_type):
+                event = '{"type": "%s", "data": "data"}' % message_type
+
+                # call the method
+                with self.assertLogs("dakara_base.websocket_client", "DEBUG") as logger:
+                    self.client.on_message(event)
+
+                # assert the effect on logger
+                self.assertListEqual(
+                    logger.output,
+                    [
+                        "ERROR:dakara_base.websocket_client:"
+                        "Event of unknown type received '{}'".format(message_type)
+                    ],
+                )
+
+        # assert the client is still running
+        self.assertFalse(self.stop.is_set())
+
     def test_on_message_failed_no_type(self):
         """Test the on message method when event has no type."""
         event = '{"data": "data"}'
@@ -382,6 +467,23 @@ class WebSocketClientTestCase(TestCase):
         _, error, _ = self.errors.get()
         self.assertIsInstance(error, ParameterError)
 
+    def test_on_error_endpoint_subclass(self):
+        """Test the callback on error with a subclass of a handled error."""
+
+        class MyConnectionResetError(ConnectionResetError):
+            pass
+
+        # pre assert
+        self.assertFalse(self.stop.is_set())
+
+        # call the method
+        self.client.on_error(MyConnectionResetError("error"))
+
+        # assert the call
+        self.assertFalse(self.errors.empty())
+        _, error, _ = self.errors.get()
+        self.assertIsInstance(error, ParameterError)
+
     def test_on_error_closed(self):
         """Test the callback on error when the connection is closed by server."""
         # pre assert
@@ -449,6 +551,23 @@ class WebSocketClientTestCase(TestCase):
         event_sent = args[0]
         self.assertEqual(json.loads(event), json.loads(event_sent))
 
+    def test_send_compact(self):
+        """Test to send message in compact form."""
+        message_type = "my_type"
+        data = {"title": "Ça plane pour moi", "artists": ["Plastic Bertrand"]}
+
+        # set the websocket
+        self.set_websocket()
+
+        # call the method
+        self.client.send(message_type, data)
+
+        # assert the call
+        self.client.websocket.send.assert_called_with(
+            '{"type":"my_type","data":{"title":"Ça plane pour moi",'
+            '"artists":["Plastic Bertrand"]}}'
+        )
+
     def test_abort_connected(self):
         """Test to abort the connection."""
         # pre assert
@@ -487,6 +606,7 @@ class WebSocketClientTestCase(TestCase):
         # assert the call
         self.assertFalse(self.client.retry)
 
+    @patch("dakara_base.websocket_client.logger")
     @patch.object(WebSocketClient, "on_error", autospec=True)
     @patch.object(WebSocketClient, "on_message", autospec=True)
     @patch.object(WebSocketClient, "on_close", autospec=True)
@@ -499,20 +619,17 @@ class WebSocketClientTestCase(TestCase):
         mocked_on_close,
         mocked_on_message,
         mocked_on_error,
+        mocked_logger,
     ):
         """Test to create and run the connection."""
         # pre assert
         self.assertIsNone(self.client.websocket)
 
         # call the method
-        with self.assertLogs("dakara_base.websocket_client", "DEBUG") as logger:
-            self.client.run()
+        self.client.run()
 
         # assert the effect on logger
-        self.assertListEqual(
-            logger.output,
-            ["DEBUG:dakara_base.websocket_client:Preparing websocket connection"],
-        )
+        mocked_logger.debug.assert_called_once_with("Preparing websocket connection")
 
         # assert the call
         mocked_websocket_app_class.assert_called_with(
@@ -533,17 +650,16 @@ class WebSocketClientTestCase(TestCase):
         websocket = MagicMock()
         _, kwargs = mocked_websocket_app_class.call_args
 
-        kwargs["on_open"](websocket)
-        self.client.on_open.assert_called_with(self.client)
-
-        kwargs["on_close"](websocket, None, None)
-        self.client.on_close.assert_called_with(self.client, None, None)
-
-        kwargs["on_message"](websocket, "message")
-        self.client.on_message.assert_called_with(self.client, "message")
-
-        kwargs["on_error"](websocket, "error")
-        self.client.on_error.assert_called_with(self.client, "error")
+        cases = [
+            ("on_open", mocked_on_open, ()),
+            ("on_close", mocked_on_close, (None, None)),
+            ("on_message", mocked_on_message, ("message",)),
+            ("on_error", mocked_on_error, ("error",)),
+        ]
+        for name, mocked_callback, args in cases:
+            with self.subTest(name=name):
+                kwargs[name](websocket, *args)
+                mocked_callback.assert_called_once_with(self.client, *args)
 
         # post assert
         # in real world, this test is impossible, since the websocket object